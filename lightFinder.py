@@ -8,9 +8,24 @@ www.miguelagenjo.com
 
 import os
 import json
+import math
+import time
+import __main__
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterable, Tuple, Union
+
+# Fast JSON – orjson when available, stdlib json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Incremental JSON parsing for very large publications (optional)
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 # Maya imports
 try:
@@ -25,14 +40,14 @@ except ImportError:
 # Qt imports – support both PySide6 (Maya 2025+) and PySide2 (Maya 2017-2024)
 try:
     from PySide6.QtWidgets import (
-        QApplication, QWidget, QVBoxLayout, QHBoxLayout,
-        QLabel, QPushButton, QComboBox, QListWidget, QListWidgetItem,
+        QWidget, QVBoxLayout, QHBoxLayout,
+        QLabel, QPushButton, QComboBox, QListWidget,
         QMessageBox, QDoubleSpinBox, QSpinBox,
         QSlider, QCheckBox, QLineEdit, QScrollArea, QColorDialog,
         QFrame, QGroupBox, QDialogButtonBox, QStyle,
         QTabWidget, QTextEdit, QInputDialog
     )
-    from PySide6.QtCore import Qt, Signal, Slot, QEvent, QSize
+    from PySide6.QtCore import Qt, Signal, Slot, QEvent, QSize, QObject, QRunnable, QThreadPool
     from PySide6.QtGui import QFont, QColor, QIcon
     try:
         from PySide6.QtCore import QLocale
@@ -40,14 +55,16 @@ try:
         QLocale = None
 except ImportError:
     from PySide2.QtWidgets import (
-        QApplication, QWidget, QVBoxLayout, QHBoxLayout,
-        QLabel, QPushButton, QComboBox, QListWidget, QListWidgetItem,
+        QWidget, QVBoxLayout, QHBoxLayout,
+        QLabel, QPushButton, QComboBox, QListWidget,
         QMessageBox, QDoubleSpinBox, QSpinBox,
         QSlider, QCheckBox, QLineEdit, QScrollArea, QColorDialog,
         QFrame, QGroupBox, QDialogButtonBox, QStyle,
         QTabWidget, QTextEdit, QInputDialog
     )
-    from PySide2.QtCore import Qt, Signal, Slot, QEvent, QSize, QLocale
+    from PySide2.QtCore import (
+        Qt, Signal, Slot, QEvent, QSize, QLocale, QObject, QRunnable, QThreadPool
+    )
     from PySide2.QtGui import QFont, QColor, QIcon
 
 # Resolve MayaQWidgetBaseMixin base: handles both Maya 2022 (mixin without QWidget)
@@ -64,7 +81,8 @@ else:
 
 # ==================== Stylesheet ====================
 
-DARK_STYLESHEET = """
+# Whitespace is collapsed once at import so Qt tokenizes a compact string per window
+DARK_STYLESHEET = " ".join("""
     QWidget {
         background-color: #333333;
         color: #CCCCCC;
@@ -146,7 +164,77 @@ DARK_STYLESHEET = """
     QScrollArea {
         border: none;
     }
-"""
+""".split())
+
+
+# ==================== JSON Helpers ====================
+
+_IO_BUFFER_SIZE = 64 * 1024
+
+# Published files above this size are streamed light by light when ijson is available
+_STREAM_THRESHOLD = 10 * 1024 * 1024
+
+# Number of descriptions kept by VersionManager.get_description
+_DESCRIPTION_CACHE_SIZE = 64
+
+# Seconds a stat of a version JSON (or a miss) is reused by VersionManager.stat_file
+_STAT_TTL = 2.0
+
+# Number of version JSON stats and misses kept by VersionManager.stat_file
+_STAT_CACHE_SIZE = 64
+
+
+def _read_bytes(path) -> bytes:
+    """Read a whole file through a 64 KB buffer"""
+    with open(path, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+        return f.read()
+
+
+def _write_bytes(path, buf: bytes):
+    """Write a whole file through a 64 KB buffer"""
+    with open(path, 'wb', buffering=_IO_BUFFER_SIZE) as f:
+        f.write(buf)
+
+
+def _finite_or_none(value):
+    """Replace NaN/Infinity floats with None, the way orjson writes them"""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: _finite_or_none(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite_or_none(v) for v in value]
+    return value
+
+
+def _json_dumps(data, pretty: bool = False) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, compact unless pretty is set
+
+    Non-finite floats are written as null by both backends.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        layout = {"indent": 2}
+    else:
+        layout = {"separators": (",", ":")}
+    try:
+        text = json.dumps(data, ensure_ascii=False, allow_nan=False, **layout)
+    except ValueError:
+        # Only walk the data when it actually holds NaN/Infinity
+        text = json.dumps(_finite_or_none(data), ensure_ascii=False, allow_nan=False, **layout)
+    return text.encode("utf-8")
+
+
+def _json_loads(buf: bytes):
+    """Parse JSON from bytes"""
+    if orjson is not None:
+        try:
+            return orjson.loads(buf)
+        except orjson.JSONDecodeError:
+            # Older files written by the stdlib may contain NaN/Infinity, which orjson rejects
+            return json.loads(buf)
+    return json.loads(buf)
 
 
 # ==================== Version Management ====================
@@ -155,16 +243,24 @@ class VersionManager:
     """Manages version control for light configurations"""
 
     def __init__(self, base_path: str = None):
+        # Directory listings keyed on the folder mtime: (result, st_mtime_ns)
+        self._assets_cache = (None, -1)
+        self._versions_cache: Dict[str, tuple] = {}
+        # Highest version number handed out per asset by this manager
+        self._max_version: Dict[str, int] = {}
+        # Descriptions: (asset, version) -> (st_mtime_ns, st_size, description or None), oldest first
+        self._description_cache: Dict[tuple, tuple] = {}
+        # Recent JSON stats: path -> (time.monotonic(), stat_result, or None if missing)
+        self._stat_cache: Dict[str, tuple] = {}
         default_path = str(Path.home() / "LgtFindr_maya") if base_path is None else base_path
         env_path = os.path.join(default_path, "env.json")
         custom_path = None
-        if os.path.exists(env_path):
-            try:
-                with open(env_path, "r") as f:
-                    data = json.load(f)
-                    custom_path = data.get("custom_path")
-            except Exception as e:
-                print(f"Warning: Could not read env.json: {e}")
+        try:
+            custom_path = _json_loads(_read_bytes(env_path)).get("custom_path")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Warning: Could not read env.json: {e}")
         if custom_path:
             published_lights_path = Path(custom_path) / "Published_lights"
             published_lights_path.mkdir(parents=True, exist_ok=True)
@@ -172,25 +268,38 @@ class VersionManager:
         else:
             self.base_path = Path(default_path)
             self.base_path.mkdir(parents=True, exist_ok=True)
+        # String form of base_path for the os.* calls on hot paths
+        self.base_path_str = os.fspath(self.base_path)
 
     def get_all_assets(self) -> List[str]:
-        """Get all published light assets"""
-        assets = []
-        if self.base_path.exists():
-            for item in self.base_path.iterdir():
-                if item.is_dir():
-                    assets.append(item.name)
-        return sorted(assets)
+        """Get all published light assets (cached until the base folder changes)"""
+        try:
+            mtime = os.stat(self.base_path_str).st_mtime_ns
+            assets, cached_mtime = self._assets_cache
+            if mtime != cached_mtime:
+                with os.scandir(self.base_path_str) as it:
+                    assets = sorted(e.name for e in it if e.is_dir())
+                self._assets_cache = (assets, mtime)
+        except FileNotFoundError:
+            return []
+        return list(assets)
 
     def get_versions(self, asset_name: str) -> List[int]:
-        """Get all versions for an asset"""
-        asset_path = self.base_path / asset_name
-        versions = []
-        if asset_path.exists():
-            for item in asset_path.iterdir():
-                if item.is_dir() and item.name.isdigit():
-                    versions.append(int(item.name))
-        return sorted(versions, reverse=True)
+        """Get all versions for an asset (cached until the asset folder changes)"""
+        asset_path = os.path.join(self.base_path_str, asset_name)
+        try:
+            mtime = os.stat(asset_path).st_mtime_ns
+            versions, cached_mtime = self._versions_cache.get(asset_name, (None, -1))
+            if mtime != cached_mtime:
+                with os.scandir(asset_path) as it:
+                    versions = sorted(
+                        (int(e.name) for e in it if e.name.isdigit() and e.is_dir()),
+                        reverse=True
+                    )
+                self._versions_cache[asset_name] = (versions, mtime)
+        except FileNotFoundError:
+            return []
+        return list(versions)
 
     def get_latest_version(self, asset_name: str) -> Optional[int]:
         """Get latest version number for an asset"""
@@ -199,27 +308,88 @@ class VersionManager:
 
     def create_new_version(self, asset_name: str) -> Path:
         """Create a new version folder for an asset"""
-        asset_path = self.base_path / asset_name
-        asset_path.mkdir(parents=True, exist_ok=True)
-        latest = self.get_latest_version(asset_name)
-        new_version = (latest or 0) + 1
-        version_path = asset_path / str(new_version)
-        version_path.mkdir(parents=True, exist_ok=True)
-        return version_path
+        return Path(self._create_version_folder(asset_name)[1])
+
+    def _create_version_folder(self, asset_name: str) -> Tuple[int, str]:
+        asset_path = os.path.join(self.base_path_str, asset_name)
+        # base_path is created in __init__, so one mkdir per level is enough
+        try:
+            os.mkdir(asset_path)
+        except FileExistsError:
+            pass
+        if asset_name not in self._max_version:
+            self._max_version[asset_name] = self.get_latest_version(asset_name) or 0
+        new_version = self._max_version[asset_name] + 1
+        # Skip numbers already taken by publishes from other sessions
+        while True:
+            version_path = os.path.join(asset_path, str(new_version))
+            try:
+                os.mkdir(version_path)
+                break
+            except FileExistsError:
+                new_version += 1
+        self._max_version[asset_name] = new_version
+        self._assets_cache = (None, -1)
+        self._versions_cache.pop(asset_name, None)
+        return new_version, version_path
 
     def get_version_path(self, asset_name: str, version: int) -> Path:
         """Get path to a specific version"""
-        return self.base_path / asset_name / str(version)
-
-    def publish_file(self, asset_name: str, file_data: Dict) -> bool:
-        """Publish a light configuration file"""
+        return Path(os.path.join(self.base_path_str, asset_name, str(version)))
+
+    def _json_path(self, asset_name: str, version) -> str:
+        return os.path.join(self.base_path_str, asset_name, str(version), f"{asset_name}.json")
+
+    def stat_file(self, asset_name: str, version: int) -> Optional[os.stat_result]:
+        """Stat a version's JSON file, or None if it does not exist
+
+        Hits and misses are reused for a couple of seconds, so JSON written by other
+        sessions shows up shortly; this session's writes call invalidate() instead.
+        """
+        file_path = self._json_path(asset_name, version)
+        now = time.monotonic()
+        cached = self._stat_cache.get(file_path)
+        if cached is not None and now - cached[0] < _STAT_TTL:
+            return cached[1]
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            st = None
+        self._stat_cache.pop(file_path, None)
+        if len(self._stat_cache) >= _STAT_CACHE_SIZE:
+            del self._stat_cache[next(iter(self._stat_cache))]
+        self._stat_cache[file_path] = (now, st)
+        return st
+
+    def invalidate(self, asset_name: str, version: int):
+        """Forget cached lookups for a version after its JSON was written"""
+        file_path = self._json_path(asset_name, version)
+        self._stat_cache.pop(file_path, None)
+        self._description_cache.pop((asset_name, version), None)
+
+    def begin_publish(self, asset_name: str, file_data: Dict) -> Tuple[int, str]:
+        """Create the next version folder and stamp publish metadata
+
+        Returns the new version number and the path its JSON should be written to.
+        """
+        version, version_path = self._create_version_folder(asset_name)
+        file_data["_published"] = datetime.now().isoformat()
+        file_data["_asset_name"] = asset_name
+        return version, os.path.join(version_path, f"{asset_name}.json")
+
+    def write_publish(self, file_path: str, file_data: Dict, pretty: bool = False):
+        """Serialize and write a publication (no Maya calls or cache updates, safe off the main thread)
+
+        Call invalidate() for the version on the owning thread once the write has finished.
+        """
+        _write_bytes(file_path, _json_dumps(file_data, pretty))
+
+    def publish_file(self, asset_name: str, file_data: Dict, pretty: bool = False) -> bool:
+        """Publish a light configuration file (pretty=True indents it for reading)"""
         try:
-            version_path = self.create_new_version(asset_name)
-            file_path = version_path / f"{asset_name}.json"
-            file_data["_published"] = datetime.now().isoformat()
-            file_data["_asset_name"] = asset_name
-            with open(file_path, 'w') as f:
-                json.dump(file_data, f, indent=2)
+            version, file_path = self.begin_publish(asset_name, file_data)
+            self.write_publish(file_path, file_data, pretty)
+            self.invalidate(asset_name, version)
             return True
         except Exception as e:
             print(f"Error publishing file: {e}")
@@ -228,18 +398,82 @@ class VersionManager:
     def load_file(self, asset_name: str, version: int) -> Optional[Dict]:
         """Load a light configuration file"""
         try:
-            version_path = self.get_version_path(asset_name, version)
-            file_path = version_path / f"{asset_name}.json"
-            if file_path.exists():
-                with open(file_path, 'r') as f:
-                    return json.load(f)
+            return _json_loads(_read_bytes(self._json_path(asset_name, version)))
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"Error loading file: {e}")
         return None
 
+    def get_description(self, asset_name: str, version: int, st: os.stat_result) -> Optional[str]:
+        """Get a version's description, reusing the last read while the file is unchanged
+
+        st is a current stat of the file. Returns None if the file could not be loaded;
+        such failures are remembered too, and not retried until the file changes.
+        """
+        key = (asset_name, version)
+        cached = self._description_cache.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        try:
+            data = _json_loads(_read_bytes(self._json_path(asset_name, version)))
+            description = data.get("description", "") if isinstance(data, dict) else ""
+        except (OSError, ValueError) as e:
+            print(f"Error loading file: {e}")
+            description = None
+        # Only the description is kept, never the (possibly very large) parsed lights
+        self._description_cache.pop(key, None)
+        if len(self._description_cache) >= _DESCRIPTION_CACHE_SIZE:
+            del self._description_cache[next(iter(self._description_cache))]
+        self._description_cache[key] = (st.st_mtime_ns, st.st_size, description)
+        return description
+
+    def iter_lights(self, asset_name: str, version: int) -> Optional[Iterable[Dict]]:
+        """Get the published lights of a version, streamed one by one for large files"""
+        file_path = self._json_path(asset_name, version)
+        try:
+            size = os.stat(file_path).st_size
+        except OSError as e:
+            print(f"Error loading file: {e}")
+            return None
+        if ijson is not None and size > _STREAM_THRESHOLD:
+            return self._stream_lights(file_path)
+        data = self.load_file(asset_name, version)
+        return data.get("lights", []) if data else None
+
+    def _stream_lights(self, file_path: str) -> Iterable[Dict]:
+        with open(file_path, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+            yield from ijson.items(f, "lights.item", use_float=True)
+
 
 # ==================== Light Finder Functions ====================
 
+# Transform channels stored with each published light
+_XFORM_PREFIXES = ("translate", "rotate", "scale", "shear")
+
+# Light node creators keyed on the published node type; anything else becomes an areaLight
+_LIGHT_CREATORS = {
+    "aiAreaLight": lambda n: cmds.shadingNode("aiAreaLight", name=f"{n}Shape", asLight=True),
+    "aiMeshLight": lambda n: cmds.shadingNode("mesh", name=f"{n}Shape", asLight=True),
+    "directionalLight": lambda n: cmds.directionalLight(name=n),
+    "pointLight": lambda n: cmds.pointLight(name=n),
+    "spotLight": lambda n: cmds.spotLight(name=n),
+    "aiSkyDomeLight": lambda n: cmds.shadingNode("aiSkyDomeLight", name=f"{n}Shape", asLight=True),
+    "aiPhotometricLight": lambda n: cmds.shadingNode("aiPhotometricLight", name=f"{n}Shape", asLight=True),
+    "areaLight": lambda n: cmds.shadingNode("areaLight", name=f"{n}Shape", asLight=True),
+}
+
+
+def _plain_attr_value(value):
+    """Convert a cmds.getAttr result to the JSON form stored in published files"""
+    if isinstance(value, (list, tuple)):
+        if len(value) == 1:
+            value = value[0]
+            return list(value) if isinstance(value, tuple) else value
+        return list(value)
+    return value
+
+
 class LightFinderFunctions:
     """Light Finder core functionality for Maya integration"""
 
@@ -250,192 +484,221 @@ class LightFinderFunctions:
         """Get currently selected lights from Maya"""
         try:
             selected = cmds.ls(selection=True)
-            lights = []
-            for obj in selected:
-                shapes = cmds.listRelatives(obj, shapes=True) or []
-                for shape in shapes:
-                    shape_type = cmds.objectType(shape)
-                    if "light" in shape_type.lower():
-                        lights.append(obj)
-                        break
-            return lights
+            if not selected:
+                return []
+            shapes = cmds.listRelatives(selected, shapes=True, fullPath=True) or []
+            if not shapes:
+                return []
+            # showType returns a flat [name, type, name, type, ...] list in one call
+            typed = cmds.ls(shapes, showType=True) or []
+            light_shapes = [
+                shape for shape, shape_type in zip(typed[::2], typed[1::2])
+                if "light" in shape_type.lower()
+            ]
+            if not light_shapes:
+                return []
+            parents = set(cmds.listRelatives(light_shapes, parent=True, fullPath=True) or [])
+            long_names = cmds.ls(selected, long=True) or []
+            return list(dict.fromkeys(
+                obj for obj, long_name in zip(selected, long_names) if long_name in parents
+            ))
         except:
             return []
 
     def get_arnold_attributes(self, shapes: List[str]) -> List[str]:
-        """Get all Arnold attributes (containing 'ai') from shapes"""
-        arnold_attrs = []
+        """Get all Arnold attributes (prefixed 'ai') from shapes"""
         try:
             if shapes:
-                all_attrs = cmds.listAttr(shapes) or []
-                for attr in all_attrs:
-                    if "ai" in attr:
-                        arnold_attrs.append(attr)
+                # Let Maya do the name filtering instead of returning every attribute
+                all_attrs = cmds.listAttr(shapes, string="ai*", read=True) or []
+                return [attr for attr in all_attrs if attr.startswith("ai")]
         except:
             pass
-        return arnold_attrs
+        return []
+
+    def _read_attributes(self, node: str, attrs: Iterable[str], target: Dict):
+        """Read attribute values from a node into target, skipping unreadable ones"""
+        get_attr = cmds.getAttr
+        for attr in attrs:
+            try:
+                target[attr] = _plain_attr_value(get_attr(f"{node}.{attr}"))
+            except:
+                continue
+
+    def _attr_matches(self, attr_path: str, value) -> bool:
+        """Check whether a plug already holds value, so the write can be skipped"""
+        try:
+            return _plain_attr_value(cmds.getAttr(attr_path)) == value
+        except:
+            return False
+
+    def get_light_shapes(self, lights: List[str]) -> Dict[str, str]:
+        """Map each light transform to its first shape with a single listRelatives call"""
+        if not lights:
+            return {}
+        # Full shape paths grouped by the leaf name of their parent transform
+        parents_by_leaf = {}
+        for shape in cmds.listRelatives(lights, shapes=True, fullPath=True) or []:
+            parent = shape.rpartition("|")[0]
+            parents_by_leaf.setdefault(parent.rpartition("|")[2], {}).setdefault(parent, shape)
+
+        shape_by_light = {}
+        for light in lights:
+            # "|light1" is an absolute path and must match exactly; partial paths match by suffix
+            absolute = light.startswith("|")
+            suffix = "|" + light
+            for parent, shape in parents_by_leaf.get(light.rpartition("|")[2], {}).items():
+                if (parent == light) if absolute else parent.endswith(suffix):
+                    shape_by_light[light] = shape
+                    break
+        return shape_by_light
 
     def collect_light_properties(self, lights: List[str]) -> Dict:
         """Collect all properties from selected lights"""
         properties = {"lights": []}
 
-        for light in lights:
+        # Viewport redraws are not needed while only reading attributes
+        cmds.refresh(suspend=True)
+        try:
             try:
-                shapes = cmds.listRelatives(light, shapes=True)
-                if shapes:
-                    shape = shapes[0]
-                    light_data = {
-                        "name": light,
-                        "type": cmds.objectType(shape),
-                        "attributes": {},
-                        "transform": {}
-                    }
-
-                    # Collect transform attributes from the light's transform node
-                    transform_attrs = cmds.listAttr(light, keyable=True) or []
-                    for attr in transform_attrs:
-                        if any(keyword in attr.lower() for keyword in ["translate", "rotate", "scale", "shear"]):
-                            try:
-                                attr_path = light + "." + attr
-                                attr_value = cmds.getAttr(attr_path)
-                                if isinstance(attr_value, (list, tuple)):
-                                    if len(attr_value) == 1:
-                                        light_data["transform"][attr] = attr_value[0]
-                                    else:
-                                        light_data["transform"][attr] = list(attr_value)
-                                else:
-                                    light_data["transform"][attr] = attr_value
-                            except:
-                                pass
-
-                    # Get all keyable attributes from the light shape
-                    all_attrs = cmds.listAttr(shape, keyable=True) or []
-                    for attr in all_attrs:
-                        try:
-                            attr_path = shape + "." + attr
-                            attr_value = cmds.getAttr(attr_path)
-                            if isinstance(attr_value, (list, tuple)):
-                                if len(attr_value) == 1:
-                                    light_data["attributes"][attr] = attr_value[0]
-                                else:
-                                    light_data["attributes"][attr] = list(attr_value)
-                            else:
-                                light_data["attributes"][attr] = attr_value
-                        except:
-                            pass
-
-                    # Get Arnold attributes
-                    arnold_attrs = self.get_arnold_attributes(shapes)
-                    for attr in arnold_attrs:
-                        try:
-                            attr_path = shape + "." + attr
-                            attr_value = cmds.getAttr(attr_path)
-                            if isinstance(attr_value, (list, tuple)):
-                                if len(attr_value) == 1:
-                                    light_data["attributes"][attr] = attr_value[0]
-                                else:
-                                    light_data["attributes"][attr] = list(attr_value)
-                            else:
-                                light_data["attributes"][attr] = attr_value
-                        except:
-                            pass
-
-                    properties["lights"].append(light_data)
+                shape_by_light = self.get_light_shapes(lights)
             except:
-                pass
+                shape_by_light = {}
+            for light in lights:
+                try:
+                    shape = shape_by_light.get(light)
+                    if shape:
+                        light_data = {
+                            "name": light,
+                            "type": cmds.objectType(shape),
+                            "attributes": {},
+                            "transform": {}
+                        }
+
+                        # Collect transform attributes from the light's transform node
+                        transform_attrs = cmds.listAttr(light, keyable=True, read=True) or []
+                        self._read_attributes(
+                            light, [a for a in transform_attrs if a.startswith(_XFORM_PREFIXES)], light_data["transform"]
+                        )
+
+                        # Keyable shape attributes plus Arnold attributes, each read once
+                        keyable_attrs = cmds.listAttr(shape, keyable=True, read=True) or []
+                        shape_attrs = dict.fromkeys(keyable_attrs + self.get_arnold_attributes([shape]))
+                        self._read_attributes(shape, shape_attrs, light_data["attributes"])
+
+                        properties["lights"].append(light_data)
+                except:
+                    pass
+        finally:
+            cmds.refresh(suspend=False)
 
         return properties
 
-    def apply_light_properties(self, properties: Dict) -> bool:
-        """Apply all light properties to scene and create exact copies of published lights"""
+    def apply_light_properties(self, properties: Union[Dict, Iterable[Dict]]) -> bool:
+        """Apply all light properties to scene and create exact copies of published lights
+
+        Accepts either a full configuration dict or an iterable of light dicts,
+        so large publications can be applied while they are still being parsed.
+        """
         try:
             created_lights = []
+            lights = properties.get("lights", []) if isinstance(properties, dict) else properties
 
-            for light_data in properties.get("lights", []):
-                try:
-                    name = light_data.get("name")
-                    light_type = light_data.get("type")
-                    attributes = light_data.get("attributes", {})
-                    transform_attrs = light_data.get("transform", {})
-
-                    light_name = name
-                    counter = 1
-                    while cmds.objExists(light_name):
-                        light_name = f"{name}_{counter}"
-                        counter += 1
+            # One undo step for the whole load, and no viewport redraws per setAttr
+            cmds.undoInfo(openChunk=True)
+            cmds.refresh(suspend=True)
+            try:
+                # Leaf names of every node in the scene, fetched once for unique naming
+                existing = {node.rpartition("|")[2] for node in cmds.ls() or []}
 
+                for light_data in lights:
                     try:
-                        new_light = None
-                        if "aiAreaLight" in light_type:
-                            new_light = cmds.shadingNode("aiAreaLight", name=f"{light_name}Shape", asLight=True)
-                        elif "aiMesh" in light_type:
-                            new_light = cmds.shadingNode("mesh", name=f"{light_name}Shape", asLight=True)
-                        elif "directional" in light_type.lower():
-                            new_light = cmds.directionalLight(name=light_name)
-                        elif "point" in light_type.lower():
-                            new_light = cmds.pointLight(name=light_name)
-                        elif "spot" in light_type.lower():
-                            new_light = cmds.spotLight(name=light_name)
-                        elif "skydome" in light_type.lower():
-                            new_light = cmds.shadingNode("aiSkyDomeLight", name=f"{light_name}Shape", asLight=True)
-                        elif "photometric" in light_type.lower():
-                            new_light = cmds.shadingNode("aiPhotometricLight", name=f"{light_name}Shape", asLight=True)
-                        else:
-                            new_light = cmds.shadingNode("areaLight", name=f"{light_name}Shape", asLight=True)
-
-                        if new_light:
-                            shapes = cmds.listRelatives(new_light, shapes=True)
-                            if not shapes:
-                                shape_node = new_light
-                                light_transform = cmds.listRelatives(new_light, parent=True)
-                                if light_transform:
-                                    light_transform = light_transform[0]
-                            else:
-                                shape_node = shapes[0]
-                                light_transform = new_light
-
-                            # Apply transform attributes
-                            transform_applied = 0
-                            for attr_name, attr_value in transform_attrs.items():
-                                try:
-                                    attr_path = light_transform + "." + attr_name
-                                    if isinstance(attr_value, list):
-                                        cmds.setAttr(attr_path, *attr_value)
-                                    else:
-                                        cmds.setAttr(attr_path, attr_value)
-                                    transform_applied += 1
-                                except Exception as e:
-                                    print(f"Warning: Could not set transform {attr_name}: {e}")
-
-                            # Apply shape attributes
-                            applied_count = 0
-                            for attr_name, attr_value in attributes.items():
-                                try:
-                                    attr_path = shape_node + "." + attr_name
+                        name = light_data.get("name")
+                        light_type = light_data.get("type")
+                        attributes = light_data.get("attributes", {})
+                        transform_attrs = light_data.get("transform", {})
+
+                        light_name = name
+                        counter = 1
+                        while light_name in existing:
+                            light_name = f"{name}_{counter}"
+                            counter += 1
+                        existing.add(light_name)
+
+                        try:
+                            creator = _LIGHT_CREATORS.get(light_type, _LIGHT_CREATORS["areaLight"])
+                            new_light = creator(light_name)
+
+                            if new_light:
+                                shapes = cmds.listRelatives(new_light, shapes=True)
+                                if not shapes:
+                                    shape_node = new_light
+                                    light_transform = cmds.listRelatives(new_light, parent=True)
+                                    if light_transform:
+                                        light_transform = light_transform[0]
+                                else:
+                                    shape_node = shapes[0]
+                                    light_transform = new_light
+
+                                # Apply transform attributes
+                                transform_applied = 0
+                                for attr_name, attr_value in transform_attrs.items():
                                     try:
+                                        attr_path = light_transform + "." + attr_name
+                                        if self._attr_matches(attr_path, attr_value):
+                                            transform_applied += 1
+                                            continue
                                         if isinstance(attr_value, list):
                                             cmds.setAttr(attr_path, *attr_value)
                                         else:
                                             cmds.setAttr(attr_path, attr_value)
-                                        applied_count += 1
-                                    except:
+                                        transform_applied += 1
+                                    except Exception as e:
+                                        print(f"Warning: Could not set transform {attr_name}: {e}")
+
+                                # Apply shape attributes
+                                applied_count = 0
+                                for attr_name, attr_value in attributes.items():
+                                    try:
+                                        attr_path = shape_node + "." + attr_name
+                                        if self._attr_matches(attr_path, attr_value):
+                                            applied_count += 1
+                                            continue
                                         try:
-                                            if isinstance(attr_value, str):
-                                                cmds.setAttr(attr_path, attr_value, type="string")
+                                            if isinstance(attr_value, list):
+                                                cmds.setAttr(attr_path, *attr_value)
                                             else:
-                                                print(f"Skipped {attr_name}: unsupported attribute type")
-                                        except Exception as e2:
-                                            print(f"Warning: Could not set {attr_name}: {e2}")
-                                except Exception as e:
-                                    print(f"Error processing attribute {attr_name}: {e}")
-
-                            print(f"Created light '{light_transform or shape_node}' with {transform_applied} transform and {applied_count} shape attributes applied")
-                            created_lights.append(light_transform if light_transform else shape_node)
-                    except Exception as e:
-                        print(f"Warning: Failed to create light {light_name}: {e}")
+                                                cmds.setAttr(attr_path, attr_value)
+                                            applied_count += 1
+                                        except:
+                                            try:
+                                                if isinstance(attr_value, str):
+                                                    cmds.setAttr(attr_path, attr_value, type="string")
+                                                else:
+                                                    print(f"Skipped {attr_name}: unsupported attribute type")
+                                            except Exception as e2:
+                                                print(f"Warning: Could not set {attr_name}: {e2}")
+                                    except Exception as e:
+                                        print(f"Error processing attribute {attr_name}: {e}")
+
+                                print(f"Created light '{light_transform or shape_node}' with {transform_applied} transform and {applied_count} shape attributes applied")
+                                created_lights.append(light_transform if light_transform else shape_node)
+                                existing.update(n for n in (light_transform, shape_node) if n)
+                        except Exception as e:
+                            print(f"Warning: Failed to create light {light_name}: {e}")
 
-                except Exception as e:
-                    print(f"Error processing light data: {e}")
+                    except Exception as e:
+                        print(f"Error processing light data: {e}")
+            except Exception as e:
+                # Only the light source itself can fail here (e.g. a truncated streamed file):
+                # remove what was already created so a bad file leaves the scene untouched
+                print(f"Error reading lights, removing {len(created_lights)} created light(s): {e}")
+                if created_lights:
+                    cmds.delete(created_lights)
+                return False
+            finally:
+                cmds.refresh(suspend=False)
+                cmds.undoInfo(closeChunk=True)
 
             if created_lights:
                 cmds.select(created_lights)
@@ -465,6 +728,35 @@ class LightFinderFunctions:
             return False
 
 
+# ==================== Background Publishing ====================
+
+class _PublishSignals(QObject):
+    # ok, error message, asset name, version
+    finished = Signal(bool, str, str, int)
+
+
+class _PublishTask(QRunnable):
+    """Writes a publication's JSON on a QThreadPool worker"""
+
+    def __init__(self, version_manager: VersionManager, asset_name: str, version: int,
+                 file_path: str, file_data: Dict):
+        super().__init__()
+        self.version_manager = version_manager
+        self.asset_name = asset_name
+        self.version = version
+        self.file_path = file_path
+        self.file_data = file_data
+        self.signals = _PublishSignals()
+
+    def run(self):
+        try:
+            self.version_manager.write_publish(self.file_path, self.file_data)
+        except Exception as e:
+            self.signals.finished.emit(False, str(e), self.asset_name, self.version)
+        else:
+            self.signals.finished.emit(True, "", self.asset_name, self.version)
+
+
 # ==================== Light Finder Tab ====================
 
 class LightFinderTab(QWidget):
@@ -476,6 +768,8 @@ class LightFinderTab(QWidget):
         self.light_finder = LightFinderFunctions(self.version_manager)
         self.current_asset = None
         self.current_version = None
+        # Signal objects of in-flight publishes, kept alive until they report back
+        self._publish_signals = set()
         self._build_ui()
 
     def _build_ui(self):
@@ -638,13 +932,18 @@ class LightFinderTab(QWidget):
 
     @Slot()
     def _refresh_assets(self):
-        self.loader_list.clear()
-        self.pub_name_combo.clear()
         assets = self.version_manager.get_all_assets()
-        for asset in assets:
-            item = QListWidgetItem(asset)
-            self.loader_list.addItem(item)
-            self.pub_name_combo.addItem(asset)
+        # Repopulate in one batch: no per-item layout passes or selection callbacks
+        self.loader_list.setUpdatesEnabled(False)
+        self.loader_list.blockSignals(True)
+        try:
+            self.loader_list.clear()
+            self.loader_list.addItems(assets)
+        finally:
+            self.loader_list.blockSignals(False)
+            self.loader_list.setUpdatesEnabled(True)
+        self.pub_name_combo.clear()
+        self.pub_name_combo.addItems(assets)
 
     @Slot()
     def _on_asset_selected(self):
@@ -698,13 +997,32 @@ class LightFinderTab(QWidget):
             description = self.pub_desc_input.toPlainText().strip()
             config_data["description"] = description
 
-            if self.version_manager.publish_file(name, config_data):
-                version = self.version_manager.get_latest_version(name)
-                self.light_finder.export_selection_to_version_folder(name, version)
-                QMessageBox.information(self, "Success", "Version published successfully!")
-                self._refresh_assets()
-            else:
+            try:
+                version, file_path = self.version_manager.begin_publish(name, config_data)
+            except Exception as e:
+                print(f"Error publishing file: {e}")
                 QMessageBox.warning(self, "Error", "Failed to publish configuration")
+                return
+
+            # JSON is written on a worker while the .ma export (Maya only) runs here
+            task = _PublishTask(self.version_manager, name, version, file_path, config_data)
+            task.signals.finished.connect(self._on_publish_finished)
+            self._publish_signals.add(task.signals)
+            QThreadPool.globalInstance().start(task)
+
+            self.light_finder.export_selection_to_version_folder(name, version)
+
+    @Slot(bool, str, str, int)
+    def _on_publish_finished(self, ok, error, asset_name, version):
+        self._publish_signals.discard(self.sender())
+        # VersionManager caches are only touched on the UI thread
+        self.version_manager.invalidate(asset_name, version)
+        if ok:
+            QMessageBox.information(self, "Success", "Version published successfully!")
+            self._refresh_assets()
+        else:
+            print(f"Error publishing file: {error}")
+            QMessageBox.warning(self, "Error", "Failed to publish configuration")
 
     @Slot()
     def _load_configuration(self):
@@ -712,12 +1030,12 @@ class LightFinderTab(QWidget):
             QMessageBox.warning(self, "Error", "Please select an asset and version")
             return
 
-        config = self.version_manager.load_file(self.current_asset, self.current_version)
+        lights = self.version_manager.iter_lights(self.current_asset, self.current_version)
 
-        if config:
-            if self.light_finder.apply_light_properties(config):
+        if lights is not None:
+            if self.light_finder.apply_light_properties(lights):
                 message = f"Version {self.current_version} loaded!\n\n"
-                message += f"Loaded {len(config.get('lights', []))} lights"
+                message += f"Loaded {len(cmds.ls(selection=True))} lights"
                 QMessageBox.information(self, "Success", message)
             else:
                 QMessageBox.warning(self, "Error", "Failed to apply light properties")
@@ -750,32 +1068,37 @@ class LightFinderTab(QWidget):
             self.current_asset, self.current_version
         )
 
-        json_file = version_path / f"{self.current_asset}.json"
         creation_date = ""
         description = ""
 
-        if json_file.exists():
-            creation_date = datetime.fromtimestamp(json_file.stat().st_ctime).strftime("%Y-%m-%d %H:%M:%S")
-            try:
-                config = self.version_manager.load_file(self.current_asset, self.current_version)
-                description = config.get("description", "") if config else ""
-            except:
-                pass
+        # One stat for both the existence check and the creation date
+        st = self.version_manager.stat_file(self.current_asset, self.current_version)
 
-        info_text = f"<b>Asset:</b><br>{self.current_asset}<br><br>"
-        info_text += f"<b>Version:</b><br>{self.current_version}<br><br>"
-        info_text += f"<b>Creation Date:</b><br>{creation_date}<br><br>"
+        if st is not None:
+            creation_date = datetime.fromtimestamp(st.st_ctime).isoformat(sep=" ", timespec="seconds")
+            description = self.version_manager.get_description(
+                self.current_asset, self.current_version, st
+            ) or ""
 
+        parts = [
+            f"<b>Asset:</b><br>{self.current_asset}",
+            f"<b>Version:</b><br>{self.current_version}",
+            f"<b>Creation Date:</b><br>{creation_date}",
+        ]
         if description:
-            info_text += f"<b>Description:</b><br>{description}<br><br>"
+            parts.append(f"<b>Description:</b><br>{description}")
+        parts.append(f"<b>Path:</b><br>{version_path}")
 
-        info_text += f"<b>Path:</b><br>{version_path}"
-
-        self.info_panel.setHtml(info_text)
+        self.info_panel.setHtml("<br><br>".join(parts))
 
 
 # ==================== Main Window ====================
 
+# Open Light Finder windows, held strongly until the next launch closes them. Stored on
+# __main__ so every copy of this script (Script Editor exec, shelf import, re-runs) shares it.
+_window_registry = __main__.__dict__.setdefault("_light_finder_windows", set())
+
+
 class LightFinderWindow(_WindowBase):
     """Light Finder + standalone window - Dockable"""
 
@@ -812,46 +1135,40 @@ class LightFinderWindow(_WindowBase):
         footer.setStyleSheet("background-color: #1A1A1A; padding: 8px; font-size: 12px; color: #777777;")
         main_layout.addWidget(footer)
 
+        _window_registry.add(self)
 
-# ==================== Application Entry Point ====================
-
-_current_window = None
 
+# ==================== Application Entry Point ====================
 
-def create_light_finder_window(base_path=None):
+def _create_light_finder_window(base_path=None):
     """Create the Light Finder window - ensures only one instance exists at a time"""
-    global _current_window
-
-    if not MAYA_AVAILABLE:
-        print("This tool requires Maya with PySide2/PySide6 support")
-        return None
-
-    app = QApplication.instance()
-    if app:
-        for widget in app.topLevelWidgets():
-            if widget.objectName() == LightFinderWindow.WINDOW_NAME:
-                try:
-                    widget.close()
-                    widget.deleteLater()
-                except:
-                    pass
-
-    if _current_window is not None:
+    old_windows = list(_window_registry)
+    _window_registry.clear()
+    for widget in old_windows:
         try:
-            _current_window.close()
-            _current_window.deleteLater()
+            widget.close()
+            widget.deleteLater()
         except:
             pass
-        _current_window = None
 
     window = LightFinderWindow(base_path)
     window.setObjectName(LightFinderWindow.WINDOW_NAME)
     window.show()
 
-    _current_window = window
-
     return window
 
 
+def _create_light_finder_window_unavailable(base_path=None):
+    """Stand-in used when the module is loaded outside Maya"""
+    print("This tool requires Maya with PySide2/PySide6 support")
+    return None
+
+
+# Resolved once at import: Maya availability cannot change during a session
+create_light_finder_window = (
+    _create_light_finder_window if MAYA_AVAILABLE else _create_light_finder_window_unavailable
+)
+
+
 if __name__ == "__main__":
     window = create_light_finder_window()